@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
 from pydantic import BaseModel
-from app.models import get_all_jobs, get_job_by_id, VideoJob
+from sqlmodel import Session, select
+from app.models import get_db, VideoJob
 
 router = APIRouter()
 
@@ -30,25 +31,25 @@ def health():
 
 
 @router.get("/jobs", response_model=list[JobResponse])
-def list_jobs():
+def list_jobs(db: Session = Depends(get_db)):
     """List all video processing jobs."""
-    return get_all_jobs()
+    return db.exec(select(VideoJob).order_by(VideoJob.created_at.desc())).all()
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
-def get_job(job_id: int):
+def get_job(job_id: int, db: Session = Depends(get_db)):
     """Get a specific job by ID."""
-    job = get_job_by_id(job_id)
+    job = db.get(VideoJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
 
 @router.post("/jobs/{job_id}/retry")
-def retry_job(job_id: int, background_tasks: BackgroundTasks):
+def retry_job(job_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Retry a failed job."""
     from app.pipeline import retry_job as _retry
-    job = get_job_by_id(job_id)
+    job = db.get(VideoJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     if job.status not in ("failed",):
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -22,11 +23,17 @@ class Settings(BaseSettings):
     poll_interval_seconds: int = 60
     data_dir: str = "./data"
     max_output_size_mb: int = 95  # Instagram limit is 100MB
+    pipeline_concurrency: int = 4  # jobs in flight per pipeline run
+    ffmpeg_concurrency: int = 1  # simultaneous encodes; libx264 already uses every core
+    ffmpeg_video_encoder: Literal["auto", "libx264", "h264_nvenc", "h264_vaapi", "h264_videotoolbox"] = "auto"
+    ffmpeg_vaapi_device: str = "/dev/dri/renderD128"
 
     # Postiz platform integration IDs (set after connecting accounts in Postiz)
     postiz_instagram_integration_id: str = ""
     postiz_facebook_integration_id: str = ""
     postiz_youtube_integration_id: str = ""
+    # Gap between posts that share one in-flight find-slot lookup (concurrent batch posts)
+    postiz_slot_spacing_minutes: int = 60
 
     @property
     def downloads_dir(self) -> Path:
@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.models import get_engine
@@ -29,7 +30,12 @@ async def lifespan(app: FastAPI):
     logger.info(f"Data directory: {settings.data_dir}")
     logger.info(f"Watching Drive folder: {settings.google_drive_folder_id}")
 
-    from app.pipeline import run_pipeline
+    from app.services.editor import get_video_encoder
+    logger.info(f"FFmpeg video encoder: {get_video_encoder()}")
+
+    from app.pipeline import run_pipeline, fail_interrupted_jobs
+
+    fail_interrupted_jobs()
 
     scheduler.add_job(
         run_pipeline,
@@ -60,6 +66,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(router)
@@ -1,9 +1,18 @@
-from datetime import datetime
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Field, SQLModel, create_engine, Session, select
 from app.config import settings
 
 
+def _utcnow() -> datetime:
+    # Naive UTC, matching what SQLite already stores; avoids deprecated utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class VideoJob(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     drive_file_id: str = Field(index=True, unique=True)
@@ -25,54 +34,103 @@ class VideoJob(SQLModel, table=True):
     postiz_post_id: Optional[str] = None
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
 
     def set_status(self, status: str, error: str = None):
+        now = _utcnow()
         self.status = status
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         if error:
             self.error = error
         if status == "done":
-            self.completed_at = datetime.utcnow()
+            self.completed_at = now
 
 
 engine = None
+_engine_lock = threading.Lock()  # download threads may all open their first session at once
+
+# expire_on_commit=False keeps jobs usable after commit without a reload SELECT
+SessionLocal = sessionmaker(class_=Session, expire_on_commit=False)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets /jobs read while the pipeline writes; NORMAL sync is safe under WAL
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
 def get_engine():
     global engine
-    if engine is None:
-        engine = create_engine(f"sqlite:///{settings.db_path}", echo=False)
-        SQLModel.metadata.create_all(engine)
+    if engine is not None:
+        return engine
+    with _engine_lock:
+        if engine is None:
+            new_engine = create_engine(
+                f"sqlite:///{settings.db_path}",
+                echo=False,
+                connect_args={"check_same_thread": False},  # shared by scheduler + API threads
+            )
+            event.listen(new_engine, "connect", _set_sqlite_pragmas)
+            SQLModel.metadata.create_all(new_engine)
+            SessionLocal.configure(bind=new_engine)
+            # Publish only once the tables exist and sessions are bound
+            engine = new_engine
     return engine
 
 
-def get_session():
-    return Session(get_engine())
-
-
-def get_job_by_drive_id(drive_file_id: str) -> Optional[VideoJob]:
-    with get_session() as session:
-        return session.exec(
-            select(VideoJob).where(VideoJob.drive_file_id == drive_file_id)
-        ).first()
+def get_session() -> Session:
+    get_engine()
+    return SessionLocal()
 
 
-def save_job(job: VideoJob):
+def get_db() -> Iterator[Session]:
+    """FastAPI dependency: one session per request."""
     with get_session() as session:
+        yield session
+
+
+@contextmanager
+def _session_scope(session: Optional[Session] = None) -> Iterator[Session]:
+    """Reuse the caller's session if given, otherwise open a short-lived one."""
+    if session is not None:
+        yield session
+    else:
+        with get_session() as own_session:
+            yield own_session
+
+
+def get_known_drive_ids(drive_file_ids: list[str], session: Optional[Session] = None) -> set[str]:
+    """Return which of the given Drive file IDs already have a job.
+
+    Selects only the indexed drive_file_id column, so SQLite answers from the
+    unique index without reading (or SQLModel building) full VideoJob rows.
+    """
+    if not drive_file_ids:
+        return set()
+    with _session_scope(session) as session:
+        return set(
+            session.exec(
+                select(VideoJob.drive_file_id).where(VideoJob.drive_file_id.in_(drive_file_ids))
+            ).all()
+        )
+
+
+def save_job(job: VideoJob, session: Optional[Session] = None):
+    is_new = job.id is None
+    with _session_scope(session) as session:
         session.add(job)
         session.commit()
-        session.refresh(job)
+        # expire_on_commit=False keeps updates current; only a new row needs reloading
+        if is_new:
+            session.refresh(job)
     return job
 
 
-def get_all_jobs() -> list[VideoJob]:
-    with get_session() as session:
-        return session.exec(select(VideoJob).order_by(VideoJob.created_at.desc())).all()
-
-
-def get_job_by_id(job_id: int) -> Optional[VideoJob]:
-    with get_session() as session:
+def get_job_by_id(job_id: int, session: Optional[Session] = None) -> Optional[VideoJob]:
+    with _session_scope(session) as session:
         return session.get(VideoJob, job_id)
@@ -5,103 +5,197 @@ For each new file found in Google Drive, it runs the full processing chain:
 
     download → analyze (Gemini) → generate captions (SRT) → edit (FFmpeg) → post (Postiz)
 
+Each stage has its own small thread pool, so several jobs are in flight at once:
+while one clip is being encoded the next can be downloading or with Gemini.
+
 Each step updates the VideoJob.status in SQLite so progress is always visible via /jobs.
+A job runs in one session; field updates are committed together with the next status
+change, so there is one transaction per stage rather than one per field.
 On any exception the job is marked `failed` with the error message stored for debugging.
+Jobs a crash or redeploy left mid-pipeline are marked `failed` at startup.
 Failed jobs can be retried via the /jobs/{id}/retry API endpoint.
 """
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+from sqlmodel import Session, select
 
 from app.config import settings
-from app.models import VideoJob, save_job, get_job_by_drive_id
+from app.models import VideoJob, save_job, get_session
 from app.services.drive_watcher import list_new_files, create_and_download_job
-from app.services.analyzer import analyze_video
+from app.services.analyzer import AnalysisResult, analyze_video
 from app.services.caption_generator import transcript_to_srt, adjust_srt_timing
 from app.services.editor import edit_video
-from app.services.postiz_client import PostizClient
+from app.services.postiz_client import AsyncPostizClient
 
 logger = logging.getLogger(__name__)
 
+# /trigger runs outside APScheduler's max_instances guard, so serialise runs here
+_pipeline_lock = threading.Lock()
+
+# Stage pool sizes: download/Gemini are I/O-bound, FFmpeg is CPU-bound, and posts
+# go one at a time so consecutive find-slot lookups don't race for the same slot.
+# The edit pool follows settings.ffmpeg_concurrency.
+DOWNLOAD_WORKERS = 2
+ANALYZE_WORKERS = 2
+POST_WORKERS = 1
+
+# Statuses a job only holds while a pipeline run is working on it
+IN_FLIGHT_STATUSES = ("downloading", "downloaded", "analyzing", "editing", "posting")
+
+# Long-lived, unlike the other stage pools: download_file caches the Drive service
+# per thread, so reusing these threads keeps one discovery client each across polls.
+_download_pool = ThreadPoolExecutor(DOWNLOAD_WORKERS, thread_name_prefix="download")
+
 
-def _update_status(job: VideoJob, status: str, error: str = None):
+def _update_status(job: VideoJob, status: str, error: str = None, session: Optional[Session] = None):
     job.set_status(status, error)
-    save_job(job)
+    save_job(job, session=session)
 
 
-def process_job(job: VideoJob):
-    """Run the full pipeline for a single VideoJob."""
-    logger.info(f"[Pipeline] Starting job {job.id}: {job.file_name}")
+def _run_on(pool: Optional[ThreadPoolExecutor], fn, *args):
+    """Run fn on the given stage pool and wait for it, or inline if there is no pool."""
+    if pool is None:
+        return fn(*args)
+    return pool.submit(fn, *args).result()
 
-    try:
-        # === ANALYZE ===
-        _update_status(job, "analyzing")
-        analysis = analyze_video(job.local_path)
-        logger.info(
-            f"[Pipeline] Analysis complete: trim {analysis.trim_start_sec:.1f}s–{analysis.trim_end_sec:.1f}s, "
-            f"hook='{analysis.hook_text}'"
-        )
 
-        # Store analysis results on the job
-        job.suggested_caption = analysis.suggested_caption
-        job.hashtags = ",".join(analysis.hashtags)
-        job.hook_text = analysis.hook_text
-        save_job(job)
-
-        # === GENERATE CAPTIONS ===
-        stem = Path(job.file_name).stem
-        srt_path = str(settings.captions_dir / f"{stem}.srt")
-
-        if analysis.transcript:
-            # Adjust transcript timing to account for trim offset
-            adjusted_transcript = []
-            for seg in analysis.transcript:
-                new_start = float(seg["start"]) - analysis.trim_start_sec
-                new_end = float(seg["end"]) - analysis.trim_start_sec
-                if new_end > 0:  # skip segments before trim start
-                    adjusted_transcript.append({
-                        "start": max(0.0, new_start),
-                        "end": max(0.0, new_end),
-                        "text": seg["text"],
-                    })
-            srt_result = transcript_to_srt(adjusted_transcript, srt_path)
-        else:
-            srt_result = None
-
-        job.captions_path = srt_result
-        save_job(job)
-
-        # === EDIT ===
-        _update_status(job, "editing")
-        output_path = str(settings.output_dir / f"{stem}_edited.mp4")
-        edited_path = edit_video(
-            input_path=job.local_path,
-            analysis=analysis,
-            srt_path=srt_result,
-            output_path=output_path,
-        )
-        job.output_path = edited_path
-        save_job(job)
-        logger.info(f"[Pipeline] Video edited: {edited_path}")
-
-        # === POST ===
-        _update_status(job, "posting")
-        client = PostizClient()
-        post_id = client.post_video(
-            file_path=edited_path,
+@dataclass
+class StagePools:
+    """Per-stage thread pools used by run_pipeline to overlap jobs.
+
+    Each job still runs its stages in order, but while one job is in FFmpeg the
+    next one can already be downloading or analyzing.
+    """
+    download: ThreadPoolExecutor
+    analyze: ThreadPoolExecutor
+    edit: ThreadPoolExecutor
+    post: ThreadPoolExecutor
+
+
+def analyze_stage(job: VideoJob, session: Session) -> AnalysisResult:
+    """Analyze with Gemini and write the SRT. Results are committed with the next status."""
+    _update_status(job, "analyzing", session=session)
+    analysis = analyze_video(job.local_path, job.drive_file_id)
+    logger.info(
+        f"[Pipeline] Analysis complete: trim {analysis.trim_start_sec:.1f}s–{analysis.trim_end_sec:.1f}s, "
+        f"hook='{analysis.hook_text}'"
+    )
+
+    # Store analysis results on the job
+    job.suggested_caption = analysis.suggested_caption
+    job.hashtags = ",".join(analysis.hashtags)
+    job.hook_text = analysis.hook_text
+
+    # === GENERATE CAPTIONS ===
+    # Per-job files (download, analysis cache, SRT, edited clip) are keyed on the Drive
+    # file ID, not the name: names like IMG_0001.MOV get reused across files
+    srt_path = str(settings.captions_dir / f"{job.drive_file_id}.srt")
+
+    if analysis.transcript:
+        # Adjust transcript timing to account for trim offset
+        adjusted_transcript = []
+        for seg in analysis.transcript:
+            new_start = float(seg["start"]) - analysis.trim_start_sec
+            new_end = float(seg["end"]) - analysis.trim_start_sec
+            if new_end > 0:  # skip segments before trim start
+                adjusted_transcript.append({
+                    "start": max(0.0, new_start),
+                    "end": max(0.0, new_end),
+                    "text": seg["text"],
+                })
+        srt_result = transcript_to_srt(adjusted_transcript, srt_path)
+    else:
+        srt_result = None
+
+    job.captions_path = srt_result
+    return analysis
+
+
+def edit_stage(job: VideoJob, analysis: AnalysisResult, session: Session) -> str:
+    """Trim, subtitle and re-encode with FFmpeg. Returns the edited file path."""
+    _update_status(job, "editing", session=session)
+    output_path = str(settings.output_dir / f"{job.drive_file_id}_edited.mp4")
+    edited_path = edit_video(
+        input_path=job.local_path,
+        analysis=analysis,
+        srt_path=job.captions_path,
+        output_path=output_path,
+    )
+    job.output_path = edited_path
+    logger.info(f"[Pipeline] Video edited: {edited_path}")
+    return edited_path
+
+
+async def _post_video(file_path: str, analysis: AnalysisResult) -> str:
+    async with AsyncPostizClient() as client:
+        return await client.post_video(
+            file_path=file_path,
             caption=analysis.suggested_caption,
             hashtags=analysis.hashtags,
         )
-        job.postiz_post_id = post_id
-        _update_status(job, "done")
-        logger.info(f"[Pipeline] Job {job.id} complete. Postiz post ID: {post_id}")
 
+
+def post_stage(job: VideoJob, analysis: AnalysisResult, session: Session) -> str:
+    """Upload and schedule the edited clip on Postiz. Returns the Postiz post ID."""
+    _update_status(job, "posting", session=session)
+    post_id = asyncio.run(_post_video(job.output_path, analysis))
+    job.postiz_post_id = post_id
+    _update_status(job, "done", session=session)
+    logger.info(f"[Pipeline] Job {job.id} complete. Postiz post ID: {post_id}")
+    return post_id
+
+
+def process_job(job: VideoJob, pools: Optional[StagePools] = None):
+    """Run the full pipeline for a single VideoJob.
+
+    With pools, each stage runs on its own stage pool (see run_pipeline); otherwise
+    the stages run inline on the calling thread. The session is handed from stage to
+    stage, never used by two threads at once.
+    """
+    logger.info(f"[Pipeline] Starting job {job.id}: {job.file_name}")
+    with get_session() as session:
+        session.add(job)
+        try:
+            analysis = _run_on(pools and pools.analyze, analyze_stage, job, session)
+            _run_on(pools and pools.edit, edit_stage, job, analysis, session)
+            _run_on(pools and pools.post, post_stage, job, analysis, session)
+
+        except Exception as e:
+            logger.exception(f"[Pipeline] Job {job.id} failed: {e}")
+            if not session.is_active:
+                session.rollback()
+            _update_status(job, "failed", error=str(e), session=session)
+
+
+def _process_drive_file(drive_file: dict, pools: StagePools):
+    """Download a new Drive file and run its job through the stage pools."""
+    try:
+        job = _run_on(pools.download, create_and_download_job, drive_file)
+        if job is None:
+            return
+        process_job(job, pools)
     except Exception as e:
-        logger.exception(f"[Pipeline] Job {job.id} failed: {e}")
-        _update_status(job, "failed", error=str(e))
+        logger.error(f"[Pipeline] Failed to process {drive_file['name']}: {e}")
 
 
 def run_pipeline():
     """Main pipeline entry point. Called by the APScheduler every poll interval."""
+    if not _pipeline_lock.acquire(blocking=False):
+        logger.info("[Pipeline] A pipeline run is already in progress, skipping.")
+        return
+    try:
+        _run_pipeline()
+    finally:
+        _pipeline_lock.release()
+
+
+def _run_pipeline():
     logger.info("[Pipeline] Scanning Google Drive for new files...")
     try:
         new_files = list_new_files()
@@ -114,12 +208,34 @@ def run_pipeline():
         return
 
     logger.info(f"[Pipeline] Found {len(new_files)} new file(s) to process.")
-    for drive_file in new_files:
-        try:
-            job = create_and_download_job(drive_file)
-            process_job(job)
-        except Exception as e:
-            logger.error(f"[Pipeline] Failed to process {drive_file['name']}: {e}")
+    # The per-file threads only sequence stages and wait; the stage pools bound the
+    # real work, and pipeline_concurrency bounds how many jobs (and their downloaded
+    # files) are in flight. Per-run pools are shut down after every file's thread is
+    # done; the download pool is shared across runs (see _download_pool).
+    job_workers = max(1, min(settings.pipeline_concurrency, len(new_files)))
+    with ThreadPoolExecutor(ANALYZE_WORKERS, thread_name_prefix="analyze") as analyze_pool, \
+            ThreadPoolExecutor(settings.ffmpeg_concurrency, thread_name_prefix="edit") as edit_pool, \
+            ThreadPoolExecutor(POST_WORKERS, thread_name_prefix="post") as post_pool:
+        pools = StagePools(_download_pool, analyze_pool, edit_pool, post_pool)
+        with ThreadPoolExecutor(job_workers, thread_name_prefix="job") as job_pool:
+            job_pool.map(_process_drive_file, new_files, [pools] * len(new_files))
+
+
+def fail_interrupted_jobs() -> int:
+    """Mark jobs left mid-pipeline by a previous process as failed. Returns how many.
+
+    Called at startup, before the scheduler runs: Drive polling skips files that
+    already have a job, so without this they would stay in flight forever.
+    """
+    with get_session() as session:
+        jobs = session.exec(select(VideoJob).where(VideoJob.status.in_(IN_FLIGHT_STATUSES))).all()
+        for job in jobs:
+            job.set_status("failed", error=f"Interrupted while {job.status} (service restarted)")
+            session.add(job)
+        session.commit()
+    if jobs:
+        logger.warning(f"[Pipeline] Marked {len(jobs)} interrupted job(s) as failed; retry via /jobs/{{id}}/retry")
+    return len(jobs)
 
 
 def retry_job(job_id: int) -> bool:
@@ -11,18 +11,27 @@ then prompts Gemini to return a structured JSON AnalysisResult containing:
   - raw_duration_sec               — total video duration
 
 The uploaded file is deleted from Gemini after analysis to avoid storage buildup.
+The result is cached as <captions_dir>/<drive_file_id>.analysis.json so retries skip Gemini.
 """
 import logging
+import os
+import random
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
 import google.generativeai as genai
+import orjson
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Gemini file-state polling backoff
+POLL_INITIAL_DELAY_SEC = 0.5
+POLL_MAX_DELAY_SEC = 10.0
+
 
 @dataclass
 class AnalysisResult:
@@ -62,18 +71,62 @@ Rules:
 """
 
 
-def analyze_video(local_path: str) -> AnalysisResult:
+_model: Optional[genai.GenerativeModel] = None
+_model_lock = threading.Lock()
+
+
+def _get_model() -> genai.GenerativeModel:
+    """Configure the Gemini client and build the model once per process."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            genai.configure(api_key=settings.gemini_api_key)
+            _model = genai.GenerativeModel(settings.gemini_model)
+        return _model
+
+
+def _analysis_cache_path(drive_file_id: str) -> Path:
+    return settings.captions_dir / f"{drive_file_id}.analysis.json"
+
+
+def analyze_video(local_path: str, drive_file_id: str) -> AnalysisResult:
+    """Get the structured analysis for a video, reusing a cached result if one exists.
+
+    The result is cached next to the captions under the Drive file ID, so retrying a
+    job that failed in edit/post doesn't upload the video to Gemini again.
+    """
+    cache_path = _analysis_cache_path(drive_file_id)
+    if cache_path.exists():
+        try:
+            result = AnalysisResult(**orjson.loads(cache_path.read_bytes()))
+            logger.info(f"Using cached analysis {cache_path}")
+            return result
+        except (orjson.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+
+    result = _analyze_with_gemini(local_path)
+
+    # Write atomically so a crash never leaves a half-written cache behind
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(asdict(result)))
+    os.replace(tmp_path, cache_path)
+    return result
+
+
+def _analyze_with_gemini(local_path: str) -> AnalysisResult:
     """Upload video to Gemini and get structured analysis."""
-    genai.configure(api_key=settings.gemini_api_key)
-    model = genai.GenerativeModel(settings.gemini_model)
+    model = _get_model()
 
     logger.info(f"Uploading {local_path} to Gemini Files API...")
     video_file = genai.upload_file(local_path, mime_type="video/mp4")
 
-    # Wait for file to be processed
+    # Wait for file to be processed: short clips are often ready within a second,
+    # long ones shouldn't be polled every few seconds, so back off with jitter.
+    delay = POLL_INITIAL_DELAY_SEC
     while video_file.state.name == "PROCESSING":
         logger.info("Gemini processing video...")
-        time.sleep(3)
+        time.sleep(delay + random.uniform(0, delay * 0.2))
+        delay = min(delay * 1.5, POLL_MAX_DELAY_SEC)
         video_file = genai.get_file(video_file.name)
 
     if video_file.state.name == "FAILED":
@@ -97,7 +150,7 @@ def analyze_video(local_path: str) -> AnalysisResult:
     raw = response.text.strip()
     logger.info(f"Gemini response received ({len(raw)} chars)")
 
-    data = json.loads(raw)
+    data = orjson.loads(raw)
 
     # Validate and clamp values
     duration = float(data.get("raw_duration_sec", 999))
@@ -1,16 +1,25 @@
 import logging
+import re
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_SRT_TIMING_LINE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2})[,.](\d{3}) --> (\d{2}):(\d{2}):(\d{2})[,.](\d{3})"
+)
+
+
+def _ms_to_srt_time(total_ms: int) -> str:
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
 
 def seconds_to_srt_time(seconds: float) -> str:
     """Convert float seconds to SRT timestamp format: HH:MM:SS,mmm"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    # Work in whole milliseconds so e.g. 3661.1 doesn't truncate to ,099
+    return _ms_to_srt_time(int(round(seconds * 1000)))
 
 
 def transcript_to_srt(transcript: list[dict], output_path: str) -> str:
@@ -24,28 +33,22 @@ def transcript_to_srt(transcript: list[dict], output_path: str) -> str:
         logger.warning("Empty transcript — no SRT file generated")
         return None
 
-    srt_lines = []
-    for i, segment in enumerate(transcript, start=1):
-        start = float(segment.get("start", 0))
-        end = float(segment.get("end", start + 2))
-        text = segment.get("text", "").strip()
-
-        if not text:
-            continue
+    to_ts = seconds_to_srt_time
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as fh:
+        for i, segment in enumerate(transcript, start=1):
+            start = float(segment.get("start", 0))
+            end = float(segment.get("end", start + 2))
+            text = segment.get("text", "").strip()
 
-        # Ensure end > start
-        if end <= start:
-            end = start + 1.5
+            if not text:
+                continue
 
-        srt_lines.append(str(i))
-        srt_lines.append(f"{seconds_to_srt_time(start)} --> {seconds_to_srt_time(end)}")
-        srt_lines.append(text)
-        srt_lines.append("")  # blank line between entries
+            # Ensure end > start
+            if end <= start:
+                end = start + 1.5
 
-    srt_content = "\n".join(srt_lines)
+            fh.write(f"{i}\n{to_ts(start)} --> {to_ts(end)}\n{text}\n\n")
 
-    path = Path(output_path)
-    path.write_text(srt_content, encoding="utf-8")
     logger.info(f"SRT file written to {output_path} ({len(transcript)} segments)")
     return output_path
 
@@ -58,22 +61,16 @@ def adjust_srt_timing(srt_path: str, offset_seconds: float) -> str:
     if offset_seconds == 0:
         return srt_path
 
+    offset_ms = int(round(offset_seconds * 1000))
+
+    def shift(m: re.Match) -> str:
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, m.groups())
+        start = h1 * 3_600_000 + m1 * 60_000 + s1 * 1000 + ms1 - offset_ms
+        end = h2 * 3_600_000 + m2 * 60_000 + s2 * 1000 + ms2 - offset_ms
+        return f"{_ms_to_srt_time(max(0, start))} --> {_ms_to_srt_time(max(0, end))}"
+
     path = Path(srt_path)
-    lines = path.read_text(encoding="utf-8").splitlines()
-    new_lines = []
-
-    for line in lines:
-        if " --> " in line:
-            parts = line.split(" --> ")
-            start = _srt_to_seconds(parts[0]) - offset_seconds
-            end = _srt_to_seconds(parts[1]) - offset_seconds
-            start = max(0.0, start)
-            end = max(0.0, end)
-            new_lines.append(f"{seconds_to_srt_time(start)} --> {seconds_to_srt_time(end)}")
-        else:
-            new_lines.append(line)
-
-    path.write_text("\n".join(new_lines), encoding="utf-8")
+    path.write_text(_SRT_TIMING_LINE.sub(shift, path.read_text(encoding="utf-8")), encoding="utf-8")
     return srt_path
 
 
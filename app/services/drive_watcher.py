@@ -1,37 +1,66 @@
 import json
 import logging
 import os
+import threading
 from pathlib import Path
+from typing import Optional
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from google.oauth2 import service_account
+from sqlalchemy.exc import IntegrityError
 from app.config import settings
-from app.models import VideoJob, get_job_by_drive_id, save_job
+from app.models import VideoJob, get_known_drive_ids, save_job
 import io
 
 logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
-SUPPORTED_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
+SUPPORTED_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024  # default is 100 KB, i.e. ~1000 requests per 100 MB clip
 
+# Credentials are parsed once per process. The service object wraps an httplib2
+# connection, which is not thread-safe, so it is built once per thread instead.
+# The cache only pays off on long-lived threads (the scheduler, the API worker
+# pool and pipeline._download_pool); a short-lived thread rebuilds it each time.
+_credentials = None
+_local = threading.local()
+
+
+def _get_credentials():
+    global _credentials
+    if _credentials is not None:
+        return _credentials
 
-def _get_drive_service():
     # Prefer inline JSON content (set as env var in Coolify/Docker)
     if settings.google_service_account_json_content:
         info = json.loads(settings.google_service_account_json_content)
-        creds = service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
+        _credentials = service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
     else:
         # Fall back to file path (local development)
-        creds = service_account.Credentials.from_service_account_file(
+        _credentials = service_account.Credentials.from_service_account_file(
             settings.google_service_account_json, scopes=SCOPES
         )
-    return build("drive", "v3", credentials=creds)
+    return _credentials
+
+
+def _get_drive_service():
+    service = getattr(_local, "service", None)
+    if service is None:
+        service = build("drive", "v3", credentials=_get_credentials(), cache_discovery=False)
+        _local.service = service
+    return service
 
 
 def list_new_files() -> list[dict]:
     """Return files from the watched folder that haven't been processed yet."""
     service = _get_drive_service()
-    query = f"'{settings.google_drive_folder_id}' in parents and trashed=false"
+    # Let Drive drop non-video files server-side. Uploads Drive couldn't type (often
+    # .mkv/.webm/.avi) come back as octet-stream, so those are kept too and the
+    # extension check below remains the authority on what we can actually process.
+    query = (
+        f"'{settings.google_drive_folder_id}' in parents and trashed=false "
+        "and (mimeType contains 'video/' or mimeType = 'application/octet-stream')"
+    )
     fields = "files(id, name, mimeType, createdTime, size)"
 
     result = service.files().list(
@@ -41,17 +70,18 @@ def list_new_files() -> list[dict]:
         pageSize=50,
     ).execute()
 
-    files = result.get("files", [])
-    new_files = []
+    files = [
+        f for f in result.get("files", [])
+        if Path(f["name"]).suffix.lower() in SUPPORTED_EXTENSIONS
+    ]
+    if not files:
+        return []
 
-    for f in files:
-        ext = Path(f["name"]).suffix.lower()
-        if ext not in SUPPORTED_EXTENSIONS:
-            continue
-        existing = get_job_by_drive_id(f["id"])
-        if existing is None:
-            new_files.append(f)
-            logger.info(f"New file detected: {f['name']} ({f['id']})")
+    # One index-only query for the whole page instead of a row lookup per file
+    known = get_known_drive_ids([f["id"] for f in files])
+    new_files = [f for f in files if f["id"] not in known]
+    for f in new_files:
+        logger.info(f"New file detected: {f['name']} ({f['id']})")
 
     return new_files
 
@@ -59,31 +89,38 @@ def list_new_files() -> list[dict]:
 def download_file(file_id: str, file_name: str) -> str:
     """Download a Drive file to the local downloads directory. Returns local path."""
     service = _get_drive_service()
-    dest = settings.downloads_dir / file_name
+    dest = settings.downloads_dir / f"{file_id}{Path(file_name).suffix}"
 
     request = service.files().get_media(fileId=file_id)
-    fh = io.FileIO(str(dest), "wb")
-    downloader = MediaIoBaseDownload(fh, request)
+    with io.FileIO(str(dest), "wb") as fh:
+        downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
 
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-        if status:
-            logger.info(f"Download {file_name}: {int(status.progress() * 100)}%")
+        done = False
+        while not done:
+            status, done = downloader.next_chunk()
+            if status:
+                logger.info(f"Download {file_name}: {int(status.progress() * 100)}%")
 
-    fh.close()
     logger.info(f"Downloaded {file_name} to {dest}")
     return str(dest)
 
 
-def create_and_download_job(drive_file: dict) -> VideoJob:
-    """Create a VideoJob record and download the file. Returns the job."""
+def create_and_download_job(drive_file: dict) -> Optional[VideoJob]:
+    """Create a VideoJob record and download the file.
+
+    Returns the job, or None if another run already claimed this Drive file
+    (drive_file_id is unique, so the insert is the dedup point).
+    """
     job = VideoJob(
         drive_file_id=drive_file["id"],
         file_name=drive_file["name"],
         status="downloading",
     )
-    save_job(job)
+    try:
+        save_job(job)
+    except IntegrityError:
+        logger.info(f"Skipping {drive_file['name']} ({drive_file['id']}): already has a job")
+        return None
 
     local_path = download_file(drive_file["id"], drive_file["name"])
     job.local_path = local_path
@@ -1,24 +1,136 @@
 import logging
 import os
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
+from typing import Optional
 
 from app.config import settings
 from app.services.analyzer import AnalysisResult
 
 logger = logging.getLogger(__name__)
 
+AUDIO_BITRATE_KBPS = 128
+QUALITY = 23  # CRF for libx264; the matching constant-quality knob on HW encoders
+# Aim the bitrate cap below max_output_size_mb: headroom for mux overhead and rate-control overshoot
+TARGET_SIZE_FRACTION = 0.92
+# Average bitrate standing in for QUALITY on encoders with no constant-quality mode
+QUALITY_EQUIVALENT_KBPS = 8000
+
+# Hardware encoders tried (in order) when FFMPEG_VIDEO_ENCODER=auto
+HW_ENCODERS = ("h264_nvenc", "h264_vaapi", "h264_videotoolbox")
+
+_video_encoder: Optional[str] = None
+
+# Caps concurrent encodes across pipeline runs and API-triggered retries alike
+_ffmpeg_slots = threading.BoundedSemaphore(settings.ffmpeg_concurrency)
+
+STDERR_TAIL_LINES = 50
+
+
+def _hw_encoder_works(encoder: str) -> bool:
+    """Trial-encode a few frames: ffmpeg lists encoders it was built with, not ones the host can run."""
+    cmd = ["ffmpeg", "-hide_banner", "-v", "error"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vaapi_device", settings.ffmpeg_vaapi_device]
+    cmd += ["-f", "lavfi", "-i", "testsrc=size=256x256:rate=30:duration=0.2"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vf", "format=nv12,hwupload"]
+    cmd += ["-c:v", encoder, "-f", "null", "-"]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=30).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def get_video_encoder() -> str:
+    """Return the H.264 encoder to use, detecting a working hardware encoder once per process."""
+    global _video_encoder
+    if _video_encoder is not None:
+        return _video_encoder
+
+    if settings.ffmpeg_video_encoder != "auto":
+        _video_encoder = settings.ffmpeg_video_encoder
+        return _video_encoder
+
+    _video_encoder = "libx264"
+    try:
+        listed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=30
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        listed = ""
+    for encoder in HW_ENCODERS:
+        if encoder in listed and _hw_encoder_works(encoder):
+            _video_encoder = encoder
+            break
+    return _video_encoder
+
+
+def _video_codec_args(encoder: str, budget_video_kbps: int) -> list[str]:
+    """Encoder flags for constant quality, capped at the clip's size-budget bitrate.
+
+    Easy footage stays well under the cap; only clips that would overshoot the size
+    limit are held to it, so one pass fits without a second transcode.
+    """
+    cap = [
+        "-maxrate", f"{budget_video_kbps}k",
+        "-bufsize", f"{budget_video_kbps * 2}k",
+    ]
+    if encoder == "h264_nvenc":
+        rate = ["-rc", "vbr", "-cq", str(QUALITY), "-b:v", "0", *cap]
+    elif encoder == "h264_vaapi":
+        rate = ["-qp", str(QUALITY)]  # CQP ignores rate caps; the size check below backs it up
+    elif encoder == "h264_videotoolbox":
+        # No CRF equivalent across all Macs: aim at a quality-equivalent bitrate,
+        # dropping to the size budget only for clips long enough to need it
+        rate = ["-b:v", f"{min(budget_video_kbps, QUALITY_EQUIVALENT_KBPS)}k", *cap]
+    else:
+        rate = ["-crf", str(QUALITY), *cap]
+
+    if encoder == "h264_nvenc":
+        return ["-c:v", encoder, "-preset", "p5", *rate, "-pix_fmt", "yuv420p"]
+    if encoder == "h264_vaapi":
+        return ["-c:v", encoder, *rate]  # frames are already nv12 on the GPU
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", encoder, *rate, "-pix_fmt", "yuv420p"]
+    return ["-c:v", "libx264", "-preset", "fast", *rate, "-pix_fmt", "yuv420p"]
+
+
+_FFMPEG_ESCAPE = str.maketrans({
+    "\\": "\\\\",
+    "'": "\\'",
+    ":": "\\:",
+    ",": "\\,",
+    "[": "\\[",
+    "]": "\\]",
+})
+
+SUBTITLE_STYLE_BOLD = (
+    "Fontname=Arial,Fontsize=14,Bold=1,"
+    "PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=1,Outline=2,"
+    "Alignment=2,MarginV=40"
+)
+SUBTITLE_STYLE_MINIMAL = (
+    "Fontname=Arial,Fontsize=12,Bold=0,"
+    "PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=1,Outline=1,"
+    "Alignment=2,MarginV=40"
+)
+
+# Hook text overlay: first 3 seconds, top-center. Fill with HOOK_FILTER_TEMPLATE % escaped_text
+HOOK_FILTER_TEMPLATE = (
+    "drawtext=text='%s':"
+    "fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf:"
+    "fontsize=48:fontcolor=white:borderw=3:bordercolor=black:"
+    "x=(w-text_w)/2:y=h*0.12:"
+    "enable='between(t,0,3)'"
+)
+
 
 def _escape_ffmpeg_text(text: str) -> str:
     """Escape special characters for FFmpeg drawtext filter."""
-    return (
-        text.replace("\\", "\\\\")
-            .replace("'", "\\'")
-            .replace(":", "\\:")
-            .replace(",", "\\,")
-            .replace("[", "\\[")
-            .replace("]", "\\]")
-    )
+    return text.translate(_FFMPEG_ESCAPE)
 
 
 def edit_video(
@@ -32,78 +144,67 @@ def edit_video(
     1. Trim to analysis.trim_start_sec – trim_end_sec
     2. Burn in subtitles from srt_path
     3. Overlay hook text for first 3 seconds
-    4. Re-encode H.264/AAC for platform compatibility
+    4. Re-encode H.264/AAC for platform compatibility (hardware encoder if available)
 
     Returns path to the output file.
     """
     trim_start = analysis.trim_start_sec
     trim_duration = analysis.trim_end_sec - analysis.trim_start_sec
 
-    hook_text = _escape_ffmpeg_text(analysis.hook_text)
-    srt_path_escaped = srt_path.replace("\\", "/").replace(":", "\\:")
-
-    # Caption style
-    if analysis.caption_style == "bold":
-        subtitle_style = (
-            "Fontname=Arial,Fontsize=14,Bold=1,"
-            "PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=1,Outline=2,"
-            "Alignment=2,MarginV=40"
-        )
-    else:
-        subtitle_style = (
-            "Fontname=Arial,Fontsize=12,Bold=0,"
-            "PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=1,Outline=1,"
-            "Alignment=2,MarginV=40"
-        )
+    subtitle_style = SUBTITLE_STYLE_BOLD if analysis.caption_style == "bold" else SUBTITLE_STYLE_MINIMAL
 
     # Build FFmpeg filter chain
     # Layer 1: subtitles (burned in)
     # Layer 2: hook text overlay (first 3 seconds, top-center)
-    subtitle_filter = f"subtitles='{srt_path_escaped}':force_style='{subtitle_style}'"
-
-    hook_filter = (
-        f"drawtext=text='{hook_text}':"
-        f"fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf:"
-        f"fontsize=48:fontcolor=white:borderw=3:bordercolor=black:"
-        f"x=(w-text_w)/2:y=h*0.12:"
-        f"enable='between(t,0,3)'"
-    )
+    hook_filter = HOOK_FILTER_TEMPLATE % _escape_ffmpeg_text(analysis.hook_text)
 
     # Only add subtitle filter if SRT exists and has content
     if srt_path and Path(srt_path).exists() and Path(srt_path).stat().st_size > 10:
+        srt_path_escaped = srt_path.replace("\\", "/").replace(":", "\\:")
+        subtitle_filter = f"subtitles='{srt_path_escaped}':force_style='{subtitle_style}'"
         video_filter = f"{subtitle_filter},{hook_filter}"
     else:
         video_filter = hook_filter
 
+    # Cap the constant-quality encode at the size budget so oversized clips don't
+    # need a second transcode
+    target_mb = settings.max_output_size_mb * TARGET_SIZE_FRACTION
+    budget_kbps = int((target_mb * 8 * 1024) / max(trim_duration, 1.0))
+    budget_video_kbps = max(budget_kbps - AUDIO_BITRATE_KBPS, 100)
+
+    encoder = get_video_encoder()
+    input_args = []
+    if encoder == "h264_vaapi":
+        input_args = ["-vaapi_device", settings.ffmpeg_vaapi_device]
+        video_filter = f"{video_filter},format=nv12,hwupload"
+
     cmd = [
-        "ffmpeg", "-y",
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        *input_args,
         "-ss", str(trim_start),
         "-t", str(trim_duration),
         "-i", input_path,
         "-vf", video_filter,
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "23",
+        *_video_codec_args(encoder, budget_video_kbps),
         "-c:a", "aac",
-        "-b:a", "128k",
+        "-b:a", f"{AUDIO_BITRATE_KBPS}k",
         "-movflags", "+faststart",
-        "-pix_fmt", "yuv420p",
         output_path,
     ]
 
-    logger.info(f"Running FFmpeg: trim {trim_start:.1f}s to {analysis.trim_end_sec:.1f}s")
+    logger.info(f"Running FFmpeg ({encoder}): trim {trim_start:.1f}s to {analysis.trim_end_sec:.1f}s")
     logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    returncode, stderr_tail = _run_ffmpeg(cmd)
 
-    if result.returncode != 0:
-        logger.error(f"FFmpeg stderr: {result.stderr[-2000:]}")
-        raise RuntimeError(f"FFmpeg failed (code {result.returncode}): {result.stderr[-500:]}")
+    if returncode != 0:
+        logger.error(f"FFmpeg stderr: {stderr_tail[-2000:]}")
+        raise RuntimeError(f"FFmpeg failed (code {returncode}): {stderr_tail[-500:]}")
 
     output_size_mb = Path(output_path).stat().st_size / (1024 * 1024)
     logger.info(f"FFmpeg complete. Output: {output_path} ({output_size_mb:.1f} MB)")
 
-    # If output is too large, re-encode with lower quality
+    # Fallback only: the cap can still miss (e.g. VAAPI's uncapped CQP)
     if output_size_mb > settings.max_output_size_mb:
         logger.warning(f"Output {output_size_mb:.1f}MB exceeds limit, re-encoding...")
         output_path = _compress_video(output_path, settings.max_output_size_mb)
@@ -111,6 +212,32 @@ def edit_video(
     return output_path
 
 
+def _run_ffmpeg(cmd: list[str], timeout: int = 300) -> tuple[int, str]:
+    """Run FFmpeg keeping only the tail of stderr in memory. Returns (returncode, stderr tail).
+
+    Raises subprocess.TimeoutExpired if FFmpeg had to be killed after timeout seconds.
+    """
+    timed_out = threading.Event()
+    with _ffmpeg_slots:
+        with subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace"
+        ) as proc:
+            def _kill():
+                timed_out.set()
+                proc.kill()
+
+            killer = threading.Timer(timeout, _kill)
+            killer.start()
+            try:
+                tail = deque(proc.stderr, maxlen=STDERR_TAIL_LINES)
+            finally:
+                killer.cancel()
+            returncode = proc.wait()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, stderr="".join(tail))
+    return returncode, "".join(tail)
+
+
 def _compress_video(input_path: str, max_mb: int) -> str:
     """Re-encode video to hit a target file size."""
     compressed_path = input_path.replace(".mp4", "_compressed.mp4")
@@ -118,7 +245,7 @@ def _compress_video(input_path: str, max_mb: int) -> str:
     target_bitrate = int((max_mb * 8 * 1024) / duration)  # kbps
 
     cmd = [
-        "ffmpeg", "-y",
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
         "-i", input_path,
         "-b:v", f"{target_bitrate}k",
         "-maxrate", f"{target_bitrate}k",
@@ -126,7 +253,9 @@ def _compress_video(input_path: str, max_mb: int) -> str:
         "-c:a", "aac", "-b:a", "96k",
         compressed_path,
     ]
-    subprocess.run(cmd, capture_output=True, timeout=300)
+    returncode, stderr_tail = _run_ffmpeg(cmd)
+    if returncode != 0:
+        raise RuntimeError(f"FFmpeg compression failed (code {returncode}): {stderr_tail[-500:]}")
     os.remove(input_path)
     return compressed_path
 
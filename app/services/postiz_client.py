@@ -8,84 +8,285 @@ Posting flow:
     3. create_post()     — POST /api/public/v1/posts (JSON, type="schedule")
 
 Authentication: Authorization header = raw API key (no Bearer prefix).
+
+PostizClient is the blocking client; AsyncPostizClient has the same API as
+coroutines and overlaps the upload with the find-slot lookup in post_video().
+Both share config, payload building and response parsing via _PostizBase.
 """
+import asyncio
+import http.client
 import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional, Union
+from urllib.parse import urlsplit
 
+import aiofiles
 import httpx
+import orjson
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_PATH = "/api/public/v1/upload"
+FIND_SLOT_PATH = "/api/public/v1/find-slot/"
+POSTS_PATH = "/api/public/v1/posts"
+
+UPLOAD_CHUNK_SIZE = 1 << 16
+
+# Per-phase timeouts: a dead host fails in seconds, a slow 500 MB upload still has time
+UPLOAD_TIMEOUT = httpx.Timeout(connect=5.0, read=300.0, write=300.0, pool=5.0)
+FIND_SLOT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+POST_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+UPLOAD_SOCKET_TIMEOUT_SEC = 300.0  # sendfile path (plain-HTTP Postiz only)
+
+CONNECT_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# A gateway 502/504 may come after Postiz already created the post, so creating a
+# post only retries on statuses that mean the request was not processed
+POST_RETRY_STATUSES = frozenset({429, 503})
+MAX_RETRIES = 3
+RETRY_BACKOFF_SEC = 0.5
+MAX_RETRY_AFTER_SEC = 60.0
+
+
+@dataclass
+class PostItem:
+    """One video to publish via AsyncPostizClient.post_videos_batch()."""
+    file_path: str
+    caption: str
+    hashtags: list[str]
+
+
+def _multipart_envelope(path: Path, field: str = "file", content_type: str = "video/mp4") -> tuple[str, bytes, bytes]:
+    """Build a single-file multipart/form-data body around the file's bytes.
+
+    Returns (Content-Type header, preamble, postamble); the body is
+    preamble + file contents + postamble, so it can be streamed without buffering.
+    """
+    boundary = os.urandom(16).hex()
+    filename = path.name.replace("\\", "\\\\").replace('"', "%22")
+    preamble = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode("utf-8")
+    postamble = f"\r\n--{boundary}--\r\n".encode("ascii")
+    return f"multipart/form-data; boundary={boundary}", preamble, postamble
+
+
+# Only trusts an "id" that is the first key of the top-level object; anything else
+# (nested ids such as integration.id, other key orders) goes through a full parse.
+_LEADING_ID = re.compile(rb'\A\s*\{\s*"id"\s*:\s*"([^"\\]+)"')
+
+
+def _extract_id(content: bytes) -> Optional[str]:
+    """Fast path: read a leading top-level "id" string without building the object."""
+    match = _LEADING_ID.match(content)
+    return match.group(1).decode() if match else None
+
+
+def _advance_slot(slot: str, steps: int, spacing: timedelta) -> str:
+    """Move an ISO slot timestamp `steps` * spacing later (unchanged if unparseable)."""
+    if steps == 0:
+        return slot
+    try:
+        dt = datetime.fromisoformat(slot.replace("Z", "+00:00"))
+    except ValueError:
+        return slot
+    dt = (dt + steps * spacing).astimezone(timezone.utc)
+    return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _with_value(skeleton: dict, value: list[dict]) -> dict:
+    post = skeleton.copy()  # C-level shallow copy; the shared skeleton is never mutated
+    post["value"] = value
+    return post
+
+
+def _now_slot() -> str:
+    """Fallback schedule date: post now."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _not_before_now(slot: str) -> str:
+    """Return slot, or now if slot is already in the past (unchanged if unparseable)."""
+    try:
+        dt = datetime.fromisoformat(slot.replace("Z", "+00:00"))
+    except ValueError:
+        return slot
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return slot if dt > datetime.now(timezone.utc) else _now_slot()
+
+
+class _PostizBase:
+    """Config, payload building and response parsing shared by both clients."""
 
-class PostizClient:
     def __init__(self):
         self.base_url = settings.postiz_api_url.rstrip("/")
         self.headers = {
             "Authorization": settings.postiz_api_key,
             "Accept": "application/json",
         }
+        # Zero-copy uploads need a plaintext socket: over TLS, sendfile() degrades to
+        # ordinary userspace send() calls, so HTTPS keeps the httpx path.
+        self._zero_copy_upload = self.base_url.startswith("http://") and hasattr(os, "sendfile")
+        # Settings don't change for the life of the process, so resolve these once
+        self._integration_ids: tuple[str, ...] = tuple(
+            id_.strip()
+            for id_ in (
+                settings.postiz_instagram_integration_id,
+                settings.postiz_facebook_integration_id,
+                settings.postiz_youtube_integration_id,
+            )
+            if id_ and id_.strip()
+        )
+        # Static parts of the create_post request, built once
+        self._json_headers = {**self.headers, "Content-Type": "application/json"}
+        # One skeleton per platform; create_post shallow-copies them and fills in "value"
+        self._post_skeletons: tuple[dict, ...] = tuple(
+            {"integration": {"id": id_}, "value": None} for id_ in self._integration_ids
+        )
+        # integration_id -> (last slot Postiz returned, times handed out)
+        self._slot_cache: dict[str, tuple[str, int]] = {}
+        self._slot_spacing = timedelta(minutes=settings.postiz_slot_spacing_minutes)
 
-    def _get_integration_ids(self) -> list[str]:
+    def _transport_options(self) -> dict:
+        """Keyword arguments for the httpx (Async)HTTPTransport holding the connection pool."""
+        return dict(
+            # HTTP/2 (needs the h2 package): HPACK-compressed repeat headers, one multiplexed connection
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=85.0),
+            retries=CONNECT_RETRIES,  # retries failed connects only, never a sent request
+        )
+
+    def _client_options(self) -> dict:
+        """Keyword arguments for the httpx (Async)Client wrapping that transport."""
+        return dict(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=UPLOAD_TIMEOUT,
+        )
+
+    def _get_integration_ids(self) -> tuple[str, ...]:
         """Return configured platform integration IDs."""
-        ids = []
-        for id_ in [
-            settings.postiz_instagram_integration_id,
-            settings.postiz_facebook_integration_id,
-            settings.postiz_youtube_integration_id,
-        ]:
-            if id_ and id_.strip():
-                ids.append(id_.strip())
-        return ids
+        return self._integration_ids
 
-    def upload_media(self, file_path: str) -> dict:
-        """Upload a video file to Postiz. Returns dict with id and path."""
-        path = Path(file_path)
-        url = f"{self.base_url}/api/public/v1/upload"
+    def _require_integration_ids(self) -> tuple[str, ...]:
+        integration_ids = self._integration_ids
+        if not integration_ids:
+            raise RuntimeError(
+                "No Postiz integration IDs configured. "
+                "Set POSTIZ_INSTAGRAM_INTEGRATION_ID, POSTIZ_FACEBOOK_INTEGRATION_ID, "
+                "and/or POSTIZ_YOUTUBE_INTEGRATION_ID in your .env"
+            )
+        return integration_ids
 
-        logger.info(f"Uploading {path.name} to Postiz at {url}...")
-        with httpx.Client(timeout=300) as client:
-            with open(file_path, "rb") as f:
-                response = client.post(
-                    url,
-                    headers=self.headers,
-                    files={"file": (path.name, f, "video/mp4")},
-                )
+    def _retry_delay(
+        self,
+        response: httpx.Response,
+        attempt: int,
+        statuses: frozenset[int] = RETRY_STATUSES,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying `response`, or None to return it as-is.
+
+        Honors a numeric Retry-After header, else backs off 0.5s, 1s, 2s, ...
+        """
+        if response.status_code not in statuses or attempt == MAX_RETRIES:
+            return None
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+            delay = min(max(0.0, retry_after), MAX_RETRY_AFTER_SEC)
+        except ValueError:
+            delay = RETRY_BACKOFF_SEC * 2 ** attempt
+        logger.warning("Postiz returned %s, retrying in %.1fs", response.status_code, delay)
+        return delay
+
+    def _sendfile_upload(self, path: Path) -> httpx.Response:
+        """Blocking plain-HTTP upload whose file body goes kernel-to-socket via sendfile(2).
 
+        Only the multipart preamble/postamble pass through Python; the response is
+        wrapped in an httpx.Response so the normal parsing applies. Failed connects
+        are retried like the httpx transport does; other socket errors raise the
+        same RuntimeError as a failed upload.
+        """
+        content_type, preamble, postamble = _multipart_envelope(path)
+        url = urlsplit(self.base_url)
+        conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=UPLOAD_TIMEOUT.connect)
+        try:
+            for attempt in range(CONNECT_RETRIES + 1):
+                try:
+                    conn.connect()
+                    break
+                except OSError:
+                    if attempt == CONNECT_RETRIES:
+                        raise
+                    time.sleep(RETRY_BACKOFF_SEC * 2 ** attempt)
+            # Connect fails fast like the httpx path; the body and response get the long timeout
+            conn.sock.settimeout(UPLOAD_SOCKET_TIMEOUT_SEC)
+
+            conn.putrequest("POST", url.path.rstrip("/") + UPLOAD_PATH, skip_accept_encoding=True)
+            for name, value in self.headers.items():
+                conn.putheader(name, value)
+            conn.putheader("Content-Type", content_type)
+            conn.putheader("Content-Length", str(len(preamble) + path.stat().st_size + len(postamble)))
+            conn.endheaders()
+            try:
+                conn.send(preamble)
+                with open(path, "rb") as f:
+                    conn.sock.sendfile(f)
+                conn.send(postamble)
+            except (BrokenPipeError, ConnectionResetError):
+                # The server may have answered early (e.g. 413) and closed; read that status
+                pass
+            resp = conn.getresponse()
+            return httpx.Response(resp.status, headers=resp.getheaders(), content=resp.read())
+        except (OSError, http.client.HTTPException) as e:
+            raise RuntimeError(f"Postiz media upload failed ({e!r})") from e
+        finally:
+            conn.close()
+
+    def _parse_upload_response(self, response: httpx.Response) -> dict:
+        logger.debug("Postiz upload over %s", response.http_version)
         if response.status_code not in (200, 201):
             raise RuntimeError(
                 f"Postiz media upload failed ({response.status_code}): {response.text}"
             )
 
-        data = response.json()
-        logger.info(f"Postiz upload response: {data}")
+        data = orjson.loads(response.content)
+        logger.debug("Postiz upload response: %.500s", data)
 
         media_id = data.get("id") or data.get("mediaId") or data.get("data", {}).get("id")
         media_path = data.get("path") or data.get("url") or data.get("data", {}).get("path", "")
         if not media_id:
             raise RuntimeError(f"Postiz upload response missing media ID: {data}")
 
-        logger.info(f"Media uploaded to Postiz: id={media_id}")
-        return {"id": str(media_id), "path": str(media_path)}
-
-    def find_next_slot(self, integration_id: str) -> str:
-        """Find the next available posting time slot for an integration. Returns ISO datetime string."""
-        url = f"{self.base_url}/api/public/v1/find-slot/"
-        params = {"integrationId": integration_id}
-
-        with httpx.Client(timeout=30) as client:
-            response = client.get(url, headers=self.headers, params=params)
+        logger.info("Media uploaded to Postiz: id=%s", media_id)
+        # Postiz sends string IDs; only convert if a numeric one ever shows up
+        return {
+            "id": media_id if isinstance(media_id, str) else str(media_id),
+            "path": media_path if isinstance(media_path, str) else str(media_path or ""),
+        }
 
+    def _parse_slot_response(self, integration_id: str, response: httpx.Response) -> str:
         if response.status_code not in (200, 201):
             logger.warning(
-                f"find-slot call failed ({response.status_code}): {response.text}. "
-                f"Falling back to posting now."
+                "find-slot call failed (%s): %.500s. Falling back to last known slot or posting now.",
+                response.status_code,
+                response.text,
             )
-            return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            return self._fallback_slot(integration_id)
 
-        data = response.json()
-        logger.info(f"find-slot response: {data}")
+        data = orjson.loads(response.content)
+        logger.debug("find-slot response: %.500s", data)
 
         slot = (
             data.get("date")
@@ -94,75 +295,195 @@ class PostizClient:
             or data.get("data", {}).get("date")
         )
         if not slot:
-            logger.warning(f"find-slot response has no date, posting now: {data}")
-            return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            logger.warning("find-slot response has no date, posting now: %.500s", data)
+            return self._fallback_slot(integration_id)
 
+        self._slot_cache[integration_id] = (slot, 1)
         return slot
 
-    def create_post(
+    def _shared_slot(self, integration_id: str) -> Optional[str]:
+        """Hand out the last slot Postiz returned, advanced past earlier hand-outs.
+
+        Used by callers that waited on another caller's in-flight find-slot lookup:
+        Postiz hasn't seen any of their posts yet, so each is placed
+        POSTIZ_SLOT_SPACING_MINUTES after the previous one instead of sharing the slot.
+        """
+        entry = self._slot_cache.get(integration_id)
+        if entry is None:
+            return None
+        slot, uses = entry
+        self._slot_cache[integration_id] = (slot, uses + 1)
+        return _advance_slot(slot, uses, self._slot_spacing)
+
+    def _fallback_slot(self, integration_id: str) -> str:
+        """On upstream failure, reuse the last known slot before posting now."""
+        slot = self._shared_slot(integration_id)
+        return _not_before_now(slot) if slot else _now_slot()
+
+    def _build_post_payload(
         self,
         media: dict,
         caption: str,
         hashtags: list[str],
-    ) -> str:
-        """Create a scheduled post in Postiz for all configured platforms. Returns post ID."""
-        integration_ids = self._get_integration_ids()
-        if not integration_ids:
-            raise RuntimeError(
-                "No Postiz integration IDs configured. "
-                "Set POSTIZ_INSTAGRAM_INTEGRATION_ID, POSTIZ_FACEBOOK_INTEGRATION_ID, "
-                "and/or POSTIZ_YOUTUBE_INTEGRATION_ID in your .env"
-            )
-
-        hashtag_str = " ".join(f"#{tag}" for tag in hashtags)
-        full_caption = f"{caption}\n\n{hashtag_str}".strip()
+        schedule_date: str,
+    ) -> dict:
+        hashtag_str = ("#" + " #".join(hashtags)) if hashtags else ""
+        if not hashtag_str:
+            full_caption = caption
+        elif caption:
+            full_caption = f"{caption}\n\n{hashtag_str}"
+        else:
+            full_caption = hashtag_str
 
-        # Find the next slot using the first integration ID
-        schedule_date = self.find_next_slot(integration_ids[0])
-        logger.info(f"Scheduling post for: {schedule_date}")
-
-        url = f"{self.base_url}/api/public/v1/posts"
-        payload = {
+        # Every platform gets the same content, so build it once and share it
+        value = [{"content": full_caption, "image": [media]}]
+        return {
             "type": "schedule",
             "date": schedule_date,
             "shortLink": False,
             "tags": [],
-            "posts": [
-                {
-                    "integration": {"id": integration_id},
-                    "value": [
-                        {
-                            "content": full_caption,
-                            "image": [media],
-                        }
-                    ],
-                }
-                for integration_id in integration_ids
-            ],
+            "posts": [_with_value(skeleton, value) for skeleton in self._post_skeletons],
         }
 
-        with httpx.Client(timeout=60) as client:
-            response = client.post(
-                url,
-                headers={**self.headers, "Content-Type": "application/json"},
-                json=payload,
-            )
-
+    def _parse_post_response(self, response: httpx.Response, platform_count: int) -> str:
         if response.status_code not in (200, 201):
             raise RuntimeError(
                 f"Postiz post creation failed ({response.status_code}): {response.text}"
             )
 
-        data = response.json()
-        logger.info(f"Postiz post response: {data}")
+        post_id = _extract_id(response.content)
+        if post_id is None:
+            data = orjson.loads(response.content)
+            logger.debug("Postiz post response: %.500s", data)
+            post_id = (
+                data.get("id")
+                or data.get("postId")
+                or str(data.get("data", {}).get("id", "unknown"))
+            )
+        logger.info("Post created in Postiz: %s → %d platforms", post_id, platform_count)
+        return post_id if isinstance(post_id, str) else str(post_id)
+
 
-        post_id = (
-            data.get("id")
-            or data.get("postId")
-            or str(data.get("data", {}).get("id", "unknown"))
+class PostizClient(_PostizBase):
+    """Postiz API client holding one keep-alive connection pool for its lifetime.
+
+    Use as a context manager (or call close()) to release the pooled connections.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(**self._transport_options()), **self._client_options()
         )
-        logger.info(f"Post created in Postiz: {post_id} → {len(integration_ids)} platforms")
-        return str(post_id)
+        # integration_id -> in-flight find-slot lookup, shared by concurrent threads
+        self._slot_lookups: dict[str, Future] = {}
+        self._slot_lock = threading.Lock()
+
+    def close(self):
+        self._client.close()
+
+    def _send_with_retry(
+        self,
+        send: Callable[[], httpx.Response],
+        statuses: frozenset[int] = RETRY_STATUSES,
+    ) -> httpx.Response:
+        """Call send(), retrying with backoff while Postiz answers one of `statuses`."""
+        for attempt in range(MAX_RETRIES + 1):
+            response = send()
+            delay = self._retry_delay(response, attempt, statuses)
+            if delay is None:
+                return response
+            time.sleep(delay)
+
+    def __enter__(self) -> "PostizClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def upload_media(self, file_path: str) -> dict:
+        """Upload a video file to Postiz. Returns dict with id and path."""
+        path = Path(file_path)
+
+        logger.info("Uploading %s to Postiz at %s%s...", path.name, self.base_url, UPLOAD_PATH)
+        if self._zero_copy_upload:
+            return self._parse_upload_response(self._send_with_retry(lambda: self._sendfile_upload(path)))
+
+        # httpx streams file objects in 64 KB chunks with a computed Content-Length
+        def send() -> httpx.Response:
+            # Reopened per attempt so a retry re-sends the file from the start
+            with open(file_path, "rb") as f:
+                return self._client.post(
+                    UPLOAD_PATH,
+                    files={"file": (path.name, f, "video/mp4")},
+                )
+
+        return self._parse_upload_response(self._send_with_retry(send))
+
+    def find_next_slot(self, integration_id: str) -> str:
+        """Find the next available posting time slot for an integration. Returns ISO datetime string.
+
+        Threads calling while a lookup is in flight share it (see _shared_slot);
+        a call after it finished asks Postiz again.
+        """
+        with self._slot_lock:
+            lookup = self._slot_lookups.get(integration_id)
+            owner = lookup is None
+            if owner:
+                lookup = self._slot_lookups[integration_id] = Future()
+
+        if not owner:
+            slot = lookup.result()
+            with self._slot_lock:
+                return _not_before_now(self._shared_slot(integration_id) or slot)
+
+        try:
+            slot = self._fetch_slot(integration_id)
+            lookup.set_result(slot)
+            return slot
+        except BaseException as e:
+            lookup.set_exception(e)
+            raise
+        finally:
+            with self._slot_lock:
+                self._slot_lookups.pop(integration_id, None)
+
+    def _fetch_slot(self, integration_id: str) -> str:
+        params = {"integrationId": integration_id}
+        try:
+            response = self._client.get(FIND_SLOT_PATH, params=params, timeout=FIND_SLOT_TIMEOUT)
+        except httpx.TransportError as e:
+            logger.warning("find-slot call failed (%r). Falling back to last known slot or posting now.", e)
+            with self._slot_lock:
+                return self._fallback_slot(integration_id)
+        with self._slot_lock:
+            return self._parse_slot_response(integration_id, response)
+
+    def create_post(
+        self,
+        media: dict,
+        caption: str,
+        hashtags: list[str],
+        schedule_date: Optional[str] = None,
+    ) -> str:
+        """Create a scheduled post in Postiz for all configured platforms. Returns post ID.
+
+        If schedule_date is not given, the next slot of the first integration is used.
+        """
+        integration_ids = self._require_integration_ids()
+
+        if schedule_date is None:
+            # Find the next slot using the first integration ID
+            schedule_date = self.find_next_slot(integration_ids[0])
+        logger.info("Scheduling post for: %s", schedule_date)
+
+        payload = self._build_post_payload(media, caption, hashtags, schedule_date)
+        body = orjson.dumps(payload)
+        response = self._send_with_retry(
+            lambda: self._client.post(POSTS_PATH, headers=self._json_headers, content=body, timeout=POST_TIMEOUT),
+            POST_RETRY_STATUSES,
+        )
+        return self._parse_post_response(response, len(integration_ids))
 
     def post_video(
         self,
@@ -173,3 +494,148 @@ class PostizClient:
         """Full flow: upload media + find slot + create scheduled post. Returns post ID."""
         media = self.upload_media(file_path)
         return self.create_post(media, caption, hashtags)
+
+
+class AsyncPostizClient(_PostizBase):
+    """Async Postiz client. Use with `async with`, or await aclose() when done."""
+
+    def __init__(self):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(**self._transport_options()), **self._client_options()
+        )
+        # integration_id -> in-flight find-slot lookup, shared by concurrent callers
+        self._slot_lookups: dict[str, asyncio.Task] = {}
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def _send_with_retry(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        statuses: frozenset[int] = RETRY_STATUSES,
+    ) -> httpx.Response:
+        """Await send(), retrying with backoff while Postiz answers one of `statuses`."""
+        for attempt in range(MAX_RETRIES + 1):
+            response = await send()
+            delay = self._retry_delay(response, attempt, statuses)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> "AsyncPostizClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def upload_media(self, file_path: str) -> dict:
+        """Upload a video file to Postiz. Returns dict with id and path."""
+        path = Path(file_path)
+        if self._zero_copy_upload:
+            logger.info("Uploading %s to Postiz at %s%s (sendfile)...", path.name, self.base_url, UPLOAD_PATH)
+            response = await self._send_with_retry(lambda: asyncio.to_thread(self._sendfile_upload, path))
+            return self._parse_upload_response(response)
+
+        content_type, preamble, postamble = _multipart_envelope(path)
+        content_length = len(preamble) + path.stat().st_size + len(postamble)
+
+        async def body():
+            # File reads go through aiofiles so they don't stall the event loop
+            # (and the concurrent find-slot call); only one chunk is held at a time.
+            yield preamble
+            async with aiofiles.open(file_path, "rb") as f:
+                while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                    yield chunk
+            yield postamble
+
+        logger.info("Uploading %s to Postiz at %s%s...", path.name, self.base_url, UPLOAD_PATH)
+        response = await self._send_with_retry(
+            lambda: self._client.post(
+                UPLOAD_PATH,
+                content=body(),  # fresh generator per attempt
+                headers={"Content-Type": content_type, "Content-Length": str(content_length)},
+            )
+        )
+        return self._parse_upload_response(response)
+
+    async def find_next_slot(self, integration_id: str) -> str:
+        """Find the next available posting time slot for an integration. Returns ISO datetime string.
+
+        Concurrent callers (e.g. post_videos_batch) share one lookup: the first gets
+        the slot Postiz returned, the rest get it advanced (see _shared_slot). A call
+        after the lookup finished asks Postiz again.
+        """
+        lookup = self._slot_lookups.get(integration_id)
+        if lookup is not None:
+            slot = await asyncio.shield(lookup)
+            return _not_before_now(self._shared_slot(integration_id) or slot)
+
+        lookup = asyncio.ensure_future(self._fetch_slot(integration_id))
+        self._slot_lookups[integration_id] = lookup
+        lookup.add_done_callback(lambda _: self._slot_lookups.pop(integration_id, None))
+        return await asyncio.shield(lookup)
+
+    async def _fetch_slot(self, integration_id: str) -> str:
+        params = {"integrationId": integration_id}
+        try:
+            response = await self._client.get(FIND_SLOT_PATH, params=params, timeout=FIND_SLOT_TIMEOUT)
+        except httpx.TransportError as e:
+            logger.warning("find-slot call failed (%r). Falling back to last known slot or posting now.", e)
+            return self._fallback_slot(integration_id)
+        return self._parse_slot_response(integration_id, response)
+
+    async def create_post(
+        self,
+        media: dict,
+        caption: str,
+        hashtags: list[str],
+        schedule_date: Optional[str] = None,
+    ) -> str:
+        """Create a scheduled post in Postiz for all configured platforms. Returns post ID."""
+        integration_ids = self._require_integration_ids()
+
+        if schedule_date is None:
+            schedule_date = await self.find_next_slot(integration_ids[0])
+        logger.info("Scheduling post for: %s", schedule_date)
+
+        payload = self._build_post_payload(media, caption, hashtags, schedule_date)
+        body = orjson.dumps(payload)
+        response = await self._send_with_retry(
+            lambda: self._client.post(POSTS_PATH, headers=self._json_headers, content=body, timeout=POST_TIMEOUT),
+            POST_RETRY_STATUSES,
+        )
+        return self._parse_post_response(response, len(integration_ids))
+
+    async def post_video(
+        self,
+        file_path: str,
+        caption: str,
+        hashtags: list[str],
+    ) -> str:
+        """Full flow with the find-slot lookup running alongside the upload. Returns post ID."""
+        integration_ids = self._require_integration_ids()
+        media, schedule_date = await asyncio.gather(
+            self.upload_media(file_path),
+            self.find_next_slot(integration_ids[0]),
+        )
+        return await self.create_post(media, caption, hashtags, schedule_date=schedule_date)
+
+    async def post_videos_batch(
+        self,
+        items: list[PostItem],
+        concurrency: int = 8,
+    ) -> list[Union[str, Exception]]:
+        """Publish many videos over this client's shared connection pool.
+
+        At most `concurrency` videos are in flight at once. Returns one entry per
+        item, in order: the Postiz post ID, or the exception that item raised
+        (one failed upload doesn't abort the rest of the batch).
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(item: PostItem) -> str:
+            async with sem:
+                return await self.post_video(item.file_path, item.caption, item.hashtags)
+
+        return await asyncio.gather(*(one(item) for item in items), return_exceptions=True)
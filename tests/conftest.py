@@ -0,0 +1,9 @@
+"""
+Shared test setup. app.config builds Settings() at import, so give the required
+secrets placeholder values; tests never call the real services.
+"""
+import os
+
+os.environ.setdefault("GOOGLE_DRIVE_FOLDER_ID", "test-folder")
+os.environ.setdefault("GEMINI_API_KEY", "test-gemini-key")
+os.environ.setdefault("POSTIZ_API_KEY", "test-postiz-key")
@@ -67,3 +67,22 @@ def test_adjust_srt_timing():
         assert "00:00:00,000 --> 00:00:02,500" in content
     finally:
         os.unlink(path)
+
+
+def test_adjust_srt_timing_clamps_and_keeps_text():
+    transcript = [
+        {"start": 1.0, "end": 3.0, "text": "Before trim"},
+        {"start": 6.25, "end": 8.0, "text": "After trim"},
+    ]
+    with tempfile.NamedTemporaryFile(suffix=".srt", delete=False) as f:
+        path = f.name
+
+    try:
+        transcript_to_srt(transcript, path)
+        adjust_srt_timing(path, offset_seconds=2.0)
+        content = open(path, encoding="utf-8").read()
+        assert "00:00:00,000 --> 00:00:01,000" in content
+        assert "00:00:04,250 --> 00:00:06,000" in content
+        assert "Before trim" in content and "After trim" in content
+    finally:
+        os.unlink(path)
@@ -0,0 +1,115 @@
+"""
+Tests for pipeline.py orchestration — Drive, Gemini, FFmpeg and Postiz are stubbed.
+"""
+import threading
+from pathlib import Path
+
+import pytest
+
+import app.models as models
+import app.pipeline as pipeline
+import app.services.drive_watcher as drive_watcher
+from app.config import settings
+from app.services.analyzer import AnalysisResult
+
+
+class _FakeMediaDownload:
+    def __init__(self, fh, request, chunksize):
+        self.fh = fh
+        self.request = request
+
+    def next_chunk(self):
+        self.fh.write(self.request)
+        return None, True
+
+
+class _FakeDriveFiles:
+    def get_media(self, fileId):
+        return f"video of {fileId}".encode()
+
+
+class _FakeDriveService:
+    def files(self):
+        return _FakeDriveFiles()
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    settings.ensure_dirs()
+    monkeypatch.setattr(models, "engine", None)
+    yield
+    if models.engine is not None:
+        models.engine.dispose()
+
+
+@pytest.fixture
+def stubbed_pipeline(temp_db, monkeypatch):
+    monkeypatch.setattr(drive_watcher, "_get_drive_service", lambda: _FakeDriveService())
+    monkeypatch.setattr(drive_watcher, "MediaIoBaseDownload", _FakeMediaDownload)
+
+    # Both jobs wait for each other inside analyze and edit, so they are in flight together
+    barrier = threading.Barrier(2, timeout=5)
+
+    def analyze_video(local_path, drive_file_id):
+        barrier.wait()
+        return AnalysisResult(
+            trim_start_sec=0.0,
+            trim_end_sec=10.0,
+            hook_text="HOOK",
+            caption_style="bold",
+            transcript=[{"start": 0.0, "end": 2.0, "text": f"words from {drive_file_id}"}],
+            suggested_caption="caption",
+            hashtags=["tag"],
+            raw_duration_sec=10.0,
+        )
+
+    def edit_video(input_path, analysis, srt_path, output_path):
+        content = Path(input_path).read_bytes() + Path(srt_path).read_bytes()
+        Path(output_path).write_bytes(content)
+        barrier.wait()
+        return output_path
+
+    posted = {}
+
+    async def post_video(file_path, analysis):
+        post_id = f"post-{len(posted)}"
+        posted[post_id] = Path(file_path).read_text()
+        return post_id
+
+    monkeypatch.setattr(pipeline, "analyze_video", analyze_video)
+    monkeypatch.setattr(pipeline, "edit_video", edit_video)
+    monkeypatch.setattr(pipeline, "_post_video", post_video)
+    monkeypatch.setattr(settings, "ffmpeg_concurrency", 2)
+    return posted
+
+
+def test_same_named_drive_files_keep_separate_files(stubbed_pipeline, monkeypatch):
+    files = [{"id": "fileA", "name": "IMG_0001.MOV"}, {"id": "fileB", "name": "IMG_0001.MOV"}]
+    monkeypatch.setattr(pipeline, "list_new_files", lambda: files)
+
+    pipeline.run_pipeline()
+
+    with models.get_session() as session:
+        jobs = {job.drive_file_id: job for job in session.exec(models.select(models.VideoJob))}
+    assert {job.status for job in jobs.values()} == {"done"}
+    for file_id, job in jobs.items():
+        posted = stubbed_pipeline[job.postiz_post_id]
+        assert f"video of {file_id}" in posted
+        assert f"words from {file_id}" in posted
+    assert len({job.local_path for job in jobs.values()}) == 2
+
+
+def test_fail_interrupted_jobs(temp_db):
+    for file_id, status in [("a", "analyzing"), ("b", "posting"), ("c", "done"), ("d", "failed")]:
+        models.save_job(models.VideoJob(drive_file_id=file_id, file_name=f"{file_id}.mp4", status=status))
+
+    assert pipeline.fail_interrupted_jobs() == 2
+
+    with models.get_session() as session:
+        jobs = {job.drive_file_id: job for job in session.exec(models.select(models.VideoJob))}
+    assert {file_id: job.status for file_id, job in jobs.items()} == {
+        "a": "failed", "b": "failed", "c": "done", "d": "failed",
+    }
+    assert jobs["b"].error == "Interrupted while posting (service restarted)"
+    assert jobs["d"].error is None
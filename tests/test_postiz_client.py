@@ -0,0 +1,256 @@
+"""
+Tests for postiz_client.py helpers — no calls to a real Postiz; the upload tests
+run against a local HTTP server and find-slot against httpx.MockTransport.
+"""
+import asyncio
+import os
+import socket
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import pytest
+
+import app.services.postiz_client as postiz_client
+from app.services.postiz_client import (
+    POST_RETRY_STATUSES,
+    AsyncPostizClient,
+    PostizClient,
+    _PostizBase,
+    _advance_slot,
+    _extract_id,
+)
+
+
+def test_advance_slot():
+    minute = timedelta(minutes=1)
+    assert _advance_slot("2026-01-01T10:00:00.000Z", 0, minute) == "2026-01-01T10:00:00.000Z"
+    assert _advance_slot("2026-01-01T10:00:00.000Z", 2, minute) == "2026-01-01T10:02:00.000Z"
+    assert _advance_slot("2026-01-01T23:59:30+00:00", 1, minute) == "2026-01-02T00:00:30.000Z"
+    assert _advance_slot("2026-01-01T12:00:00+02:00", 1, minute) == "2026-01-01T10:01:00.000Z"
+    assert _advance_slot("not a date", 3, minute) == "not a date"
+
+
+def test_shared_slot_spaces_out_reuses():
+    client = _PostizBase()
+    client._slot_spacing = timedelta(hours=2)
+    client._slot_cache["ig"] = ("2026-01-01T10:00:00.000Z", 1)
+
+    assert client._shared_slot("ig") == "2026-01-01T12:00:00.000Z"
+    assert client._shared_slot("ig") == "2026-01-01T14:00:00.000Z"
+    assert client._shared_slot("yt") is None
+
+
+def test_fallback_slot_reuses_last_known_slot():
+    client = _PostizBase()
+    client._slot_spacing = timedelta(minutes=30)
+    client._slot_cache["ig"] = ("2999-01-01T10:00:00.000Z", 1)
+
+    assert client._fallback_slot("ig") == "2999-01-01T10:30:00.000Z"
+
+
+def test_fallback_slot_never_in_the_past():
+    client = _PostizBase()
+    client._slot_cache["ig"] = ("2020-01-01T10:00:00.000Z", 1)
+
+    slot = datetime.fromisoformat(client._fallback_slot("ig").replace("Z", "+00:00"))
+    assert slot > datetime.now(timezone.utc) - timedelta(seconds=5)
+    assert client._fallback_slot("yt")  # nothing cached: post now
+
+
+def _find_slot_client(handler) -> PostizClient:
+    client = PostizClient()
+    client._client.close()
+    client._client = httpx.Client(base_url="http://postiz.test", transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_sequential_find_slot_asks_postiz_each_time():
+    slots = iter(["2999-01-01T10:00:00.000Z", "2999-01-01T18:00:00.000Z"])
+
+    def handler(request):
+        return httpx.Response(200, json={"date": next(slots)})
+
+    with _find_slot_client(handler) as client:
+        assert client.find_next_slot("ig") == "2999-01-01T10:00:00.000Z"
+        assert client.find_next_slot("ig") == "2999-01-01T18:00:00.000Z"
+
+
+class _CountingFuture(Future):
+    """Future that records each thread about to block on result()."""
+    waiting = None  # threading.Semaphore, set per test
+
+    def result(self, timeout=None):
+        self.waiting.release()
+        return super().result(timeout)
+
+
+def test_concurrent_find_slot_shares_one_lookup(monkeypatch):
+    calls = []
+    release = threading.Event()
+    monkeypatch.setattr(_CountingFuture, "waiting", threading.Semaphore(0))
+    monkeypatch.setattr(postiz_client, "Future", _CountingFuture)
+
+    def handler(request):
+        calls.append(request)
+        release.wait(5)
+        return httpx.Response(200, json={"date": "2999-01-01T10:00:00.000Z"})
+
+    with _find_slot_client(handler) as client:
+        client._slot_spacing = timedelta(hours=1)
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(client.find_next_slot, "ig") for _ in range(3)]
+            for _ in range(2):  # both other threads have joined the in-flight lookup
+                assert _CountingFuture.waiting.acquire(timeout=5)
+            release.set()
+            slots = sorted(f.result() for f in futures)
+
+    assert len(calls) == 1
+    assert slots == ["2999-01-01T10:00:00.000Z", "2999-01-01T11:00:00.000Z", "2999-01-01T12:00:00.000Z"]
+
+
+async def _async_find_slots(handler, count: int, slot_cache: Optional[dict] = None) -> list[str]:
+    async with AsyncPostizClient() as client:
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(base_url="http://postiz.test", transport=httpx.MockTransport(handler))
+        client._slot_spacing = timedelta(hours=1)
+        client._slot_cache.update(slot_cache or {})
+        # gather starts every call before the shared lookup's request runs
+        return list(await asyncio.gather(*(client.find_next_slot("ig") for _ in range(count))))
+
+
+def test_async_concurrent_find_slot_shares_one_lookup():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"date": "2999-01-01T10:00:00.000Z"})
+
+    slots = asyncio.run(_async_find_slots(handler, 3))
+
+    assert len(calls) == 1
+    assert slots == ["2999-01-01T10:00:00.000Z", "2999-01-01T11:00:00.000Z", "2999-01-01T12:00:00.000Z"]
+
+
+def test_async_failed_shared_lookup_never_schedules_in_the_past():
+    def handler(request):
+        return httpx.Response(500, text="boom")
+
+    stale = {"ig": ("2020-01-01T10:00:00.000Z", 1)}
+    slots = asyncio.run(_async_find_slots(handler, 3, stale))
+
+    now = datetime.now(timezone.utc) - timedelta(seconds=5)
+    for slot in slots:
+        assert datetime.fromisoformat(slot.replace("Z", "+00:00")) > now
+
+
+def test_retry_delay():
+    client = _PostizBase()
+    assert client._retry_delay(httpx.Response(503, headers={"Retry-After": "-1"}), 0) == 0.0
+    assert client._retry_delay(httpx.Response(429, headers={"Retry-After": "5"}), 0) == 5.0
+    assert client._retry_delay(httpx.Response(502), 1) == 1.0
+    assert client._retry_delay(httpx.Response(502), 0, POST_RETRY_STATUSES) is None
+    assert client._retry_delay(httpx.Response(400), 0) is None
+
+
+def test_extract_id_leading_string_id():
+    assert _extract_id(b'{"id":"abc123","group":"g"}') == "abc123"
+    assert _extract_id(b' \n{ "id" : "abc-123" , "posts": []}') == "abc-123"
+
+
+def test_extract_id_defers_other_shapes_to_full_parse():
+    assert _extract_id(b'{"integration":{"id":"int1"},"id":"p1"}') is None
+    assert _extract_id(b'{"postId":"p1","id":"p1"}') is None
+    assert _extract_id(b'{"id":"a\\"b"}') is None  # escaped quote inside the id
+    assert _extract_id(b'{"id":42}') is None
+    assert _extract_id(b'{"id":""}') is None
+    assert _extract_id(b'[{"id":"p1"}]') is None
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.server.reject_with:
+            self.send_response(self.server.reject_with)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            self.close_connection = True
+            return
+        self.server.received = (self.path, self.headers, self.rfile.read(int(self.headers["Content-Length"])))
+        body = b'{"id":"m1","path":"/uploads/m1.mp4"}'
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _upload_server(reject_with=None):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UploadHandler)
+    server.reject_with = reject_with
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _video_file(size: int) -> Path:
+    fd, name = tempfile.mkstemp(suffix=".mp4")
+    with os.fdopen(fd, "wb") as f:
+        f.write(os.urandom(size))
+    return Path(name)
+
+
+def test_sendfile_upload_round_trips_multipart_body():
+    server = _upload_server()
+    path = _video_file(200_000)
+    try:
+        client = _PostizBase()
+        client.base_url = f"http://127.0.0.1:{server.server_port}"
+        media = client._parse_upload_response(client._sendfile_upload(path))
+
+        request_path, headers, body = server.received
+        boundary = headers["Content-Type"].split("boundary=")[1]
+        assert request_path == postiz_client.UPLOAD_PATH
+        assert body.startswith(f"--{boundary}\r\n".encode())
+        assert body.endswith(f"\r\n--{boundary}--\r\n".encode())
+        assert path.read_bytes() in body
+        assert media == {"id": "m1", "path": "/uploads/m1.mp4"}
+    finally:
+        server.shutdown()
+        server.server_close()
+        path.unlink()
+
+
+def test_sendfile_upload_reports_early_rejection():
+    server = _upload_server(reject_with=413)
+    path = _video_file(8 * 1024 * 1024)
+    try:
+        client = _PostizBase()
+        client.base_url = f"http://127.0.0.1:{server.server_port}"
+        with pytest.raises(RuntimeError, match="413"):
+            client._parse_upload_response(client._sendfile_upload(path))
+    finally:
+        server.shutdown()
+        server.server_close()
+        path.unlink()
+
+
+def test_sendfile_upload_wraps_connection_errors(monkeypatch):
+    monkeypatch.setattr(postiz_client, "RETRY_BACKOFF_SEC", 0)
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]  # nothing listens here once the socket is closed
+    path = _video_file(1024)
+    try:
+        client = _PostizBase()
+        client.base_url = f"http://127.0.0.1:{port}"
+        with pytest.raises(RuntimeError, match="Postiz media upload failed"):
+            client._sendfile_upload(path)
+    finally:
+        path.unlink()